@@ -8,6 +8,7 @@ from game import GameController, GameModel, GameView
 if __name__ == "__main__":
     pygame.init()
     screen = pygame.display.set_mode((860, 600), pygame.DOUBLEBUF)
+    pygame.display.set_caption("Hungry Chameleon")
     model = GameModel(screen)
     view = GameView(screen)
     controller = GameController(model, view)
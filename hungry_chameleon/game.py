@@ -7,9 +7,11 @@ The module is structured using the MVC pattern:
 - GameController orchestrates the game loop, input handling, and updates.
 """
 
+from collections import OrderedDict
+from functools import partial
 import pygame
 from models import Chameleon, Fly
-from utils import get_random_position, load_sprite
+from utils import get_random_position, get_scaled_sprite
 from pygame.math import Vector2
 from pygame.transform import rotozoom
 
@@ -30,12 +32,15 @@ class GameModel:
         high_score_file (str): The path of the txt file holding the user's high
         score
         high_score (int): The user's high score
+        high_score_saved (bool): Stores whether the high score file is up to
+        date with high_score
         font (pygame.font): The font used to display text
         tongue_time (int): Stores how long the chameleon has had the tongue out
         game_over (bool): Stores whether the game is active or not
     """
 
     MIN_FLY_DISTANCE = 250
+    MIN_FLY_DISTANCE_SQ = MIN_FLY_DISTANCE**2
 
     def __init__(self, screen):
         """
@@ -45,14 +50,24 @@ class GameModel:
             screen (pygame.Surface): The display surface.
         """
         self.screen = screen
-        self.chameleon = Chameleon((400, 300), (400, 300), self.screen)
-        self.fly = self._init_flies(6)
-        self.score = 0
         self.high_score_file = "HIGH_SCORE_FILE.txt"
         self.high_score = self.load_high_score()
+        self.high_score_saved = True
         self.font = pygame.font.Font("assets/fonts/Pulang.ttf", 40)
+        self._game_objects = []
+        self.reset()
+
+    def reset(self):
+        """
+        Starts a new game with a fresh chameleon, flies and score, keeping
+        the loaded high score and font.
+        """
+        self.chameleon = Chameleon((400, 300), (400, 300), self.screen)
+        self.fly = self._init_flies(6)
+        self.score = 0
         self.tongue_time = 0
         self.game_over = False
+        self._update_game_objects()
 
     def _init_flies(self, count):
         """
@@ -66,12 +81,14 @@ class GameModel:
             flies (list): A list of initialized flies.
         """
         flies = []
+        width, height = self.screen.get_size()
+        chameleon_position = self.chameleon.position
         for _ in range(count):
             while True:
-                position = get_random_position(self.screen)
+                position = get_random_position(width, height)
                 if (
-                    position.distance_to(self.chameleon.position)
-                    > self.MIN_FLY_DISTANCE
+                    position.distance_squared_to(chameleon_position)
+                    > self.MIN_FLY_DISTANCE_SQ
                 ):
                     break
             flies.append(Fly(position, self.screen))
@@ -82,8 +99,10 @@ class GameModel:
         Updates all game objects in the model. Moves each object and checks
         for collisions.
         """
-        for game_object in self.get_game_objects():
-            game_object.move()
+        for fly in self.fly:
+            fly.move()
+        if self.chameleon:
+            self.chameleon.move()
         self.check_collisions()
 
     def update_tongue_time(self):
@@ -100,26 +119,41 @@ class GameModel:
         Returns:
             list: A list containing the chameleon and all flies.
         """
-        return [*self.fly, self.chameleon] if self.chameleon else self.fly
+        return self._game_objects
 
-    def check_collisions(self):
+    def _update_game_objects(self):
         """
-        Checks for collisions between the chameleon and any fly. Sets the
-        chameleon to None if a collision occurs, effectively removing it from
-        the game.
+        Rebuilds the list of active game objects. Must be called whenever a
+        fly or the chameleon is added or removed.
         """
-        for fly in self.fly:
-            if fly.collides_with(self.chameleon):
-                if self.chameleon.tongue:
-                    self.fly.remove(fly)
-                    self.score += 100
-                    if self.score > self.high_score:
-                        self.high_score = self.score
-                        self.save_high_score()
-                else:
-                    self.chameleon = None
-                    self.game_over = True
-                    break
+        self._game_objects = (
+            [*self.fly, self.chameleon] if self.chameleon else list(self.fly)
+        )
+
+    def check_collisions(self):
+        """
+        Checks for collisions between the chameleon and any fly. Flies the
+        chameleon catches with its tongue out are removed and scored; otherwise
+        sets the chameleon to None if a collision occurs, effectively removing
+        it from the game.
+        """
+        if self.chameleon is None:
+            return
+        hits = [fly for fly in self.fly if fly.collides_with(self.chameleon)]
+        if not hits:
+            return
+        if not self.chameleon.tongue:
+            self.chameleon = None
+            self.game_over = True
+            self._update_game_objects()
+            self.flush_high_score()
+            return
+        self.fly = [fly for fly in self.fly if fly not in hits]
+        self._update_game_objects()
+        self.score += 100 * len(hits)
+        if self.score > self.high_score:
+            self.high_score = self.score
+            self.high_score_saved = False
 
     def load_high_score(self):
         """
@@ -138,6 +172,15 @@ class GameModel:
         """
         with open(self.high_score_file, "w") as f:
             f.write(str(self.high_score))
+        self.high_score_saved = True
+
+    def flush_high_score(self):
+        """
+        Saves the high score to the high score file if it has been beaten
+        since it was last saved.
+        """
+        if not self.high_score_saved:
+            self.save_high_score()
 
     def check_game_over(self):
         """
@@ -163,10 +206,29 @@ class GameView:
         game_over_font (pygame.font): The font used in the game to display game
         over message
         overlay_color (tuple): Holds the background color for instructions page
-
+        game_over_overlay (pygame.Surface): The screen-sized overlay drawn
+        behind the game over banner
+        restart_text (pygame.Surface): The rendered restart prompt of the game
+        over banner
+        rotation_cache (OrderedDict): Rotated sprites and their half sizes
+        keyed by the source sprite and the rotation angle in whole degrees
+        rotation_cache_bytes (int): The pixel memory held by the rotated
+        copies in rotation_cache
+        previous_rects (list of pygame.Rect): The areas drawn over on the
+        previous frame, or None if the whole screen needs to be redrawn
+        batch_blit (method): The screen's method for blitting a sequence of
+        (surface, position) pairs in one call
+        text_cache (dict): Rendered HUD text keyed by the text and its color
 
     """
 
+    # A rotated chameleon sprite takes 0.3-0.85 MB, so this keeps roughly
+    # 40-100 rotations, rather than all 240 a game can reach (about 150 MB).
+    # That covers swinging back and forth within about 60 degrees. A full
+    # turn visits all 120 angles in order and misses on every one of them.
+    ROTATION_CACHE_BYTES = 32 * 1024 * 1024
+    TEXT_CACHE_SIZE = 16
+
     def __init__(self, screen):
         """
         Initializes the game view with a display surface.
@@ -175,13 +237,30 @@ class GameView:
             screen (pygame.Surface): The display surface.
         """
         self.screen = screen
-        self.background = pygame.transform.scale(
-            load_sprite("background_score", False), (860, 600)
+        self.background = get_scaled_sprite(
+            "background_score", self.screen.get_size(), False
         )
         self.font = pygame.font.Font("assets/fonts/Pulang.ttf", 38)
         self.score_font = pygame.font.Font("assets/fonts/Pulang.ttf", 38)
         self.game_over_font = pygame.font.Font("assets/fonts/Pulang.ttf", 32)
         self.overlay_color = (0, 0, 0, 128)
+        self.game_over_overlay = pygame.Surface(self.screen.get_size())
+        self.game_over_overlay.fill(self.overlay_color)
+        self.restart_text = self.game_over_font.render(
+            "Press Enter to restart.",
+            True,
+            (255, 0, 0),
+        )
+        self.rotation_cache = OrderedDict()
+        self.rotation_cache_bytes = 0
+        self.text_cache = {}
+        self.previous_rects = None
+        # Surface.fblits is only available on pygame-ce; fall back to blits,
+        # without having it build a list of Rects the view never reads.
+        if hasattr(self.screen, "fblits"):
+            self.batch_blit = self.screen.fblits
+        else:
+            self.batch_blit = partial(self.screen.blits, doreturn=0)
 
     def draw(
         self, game_objects, score, high_score, color=(0, 0, 0), game_over=False
@@ -189,6 +268,13 @@ class GameView:
         """
         Draws the background and all active game objects to the screen.
 
+        Only the areas covered by the previous frame's objects and text are
+        restored from the background and pushed to the display, unless the
+        whole screen has been drawn over since or the display is page flipped.
+        This relies on the window still showing what was pushed last frame,
+        so whoever learns that the window was exposed must set previous_rects
+        to None to have the next frame repaint it in full.
+
         Args:
             game_objects (list): A list of game objects to be drawn.
             score (int): The player's score
@@ -196,17 +282,37 @@ class GameView:
             color (tuple):  The color black
             game_over (bool): Used to determine if the game is over or not.
         """
-        self.screen.blit(self.background, (0, 0))
-        for game_object in game_objects:
-            game_object.draw()
-        self.draw_score(score, color)
-        self.draw_high_score(high_score, color)
+        blit_sequence = [
+            self.get_blit_item(game_object) for game_object in game_objects
+        ]
+        # A page flipped back buffer holds an older frame, so it cannot be
+        # patched up from the previous frame's rects.
+        double_buffered = self.screen.get_flags() & pygame.DOUBLEBUF
+        if self.previous_rects is None or double_buffered:
+            self.screen.blit(self.background, (0, 0))
+            dirty_rects = [self.screen.get_rect()]
+        else:
+            for rect in self.previous_rects:
+                self.screen.blit(self.background, rect, rect)
+            dirty_rects = self.previous_rects
+        self.batch_blit(blit_sequence)
+        screen_rect = self.screen.get_rect()
+        new_rects = [
+            screen_rect.clip(pygame.Rect(position, surface.get_size()))
+            for surface, position in blit_sequence
+        ]
+        new_rects.append(self.draw_score(score, color))
+        new_rects.append(self.draw_high_score(high_score, color))
         if game_over:
             self.draw_game_over(score)
+            self.previous_rects = None
+            new_rects = [screen_rect]
         else:
-            for game_object in game_objects:
-                self.draw_object(game_object)
-        pygame.display.update()
+            self.previous_rects = new_rects
+        if double_buffered:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects + new_rects)
 
     def draw_score(self, score, color):
         """
@@ -216,9 +322,11 @@ class GameView:
             score (int): The player's score.
             color (tuple):  The color ir the text.
 
+        Returns:
+            pygame.Rect: The area of the screen drawn over.
         """
-        score_text = self.font.render(f"Score: {score}", True, color)
-        self.screen.blit(score_text, (40, 13))
+        score_text = self.get_text(f"Score: {score}", color)
+        return self.screen.blit(score_text, (40, 13))
 
     def draw_high_score(self, high_score, color):
         """
@@ -228,25 +336,93 @@ class GameView:
             high_score (int): The player's high score.
             color (tuple): The color of the text.
             position (tuple): The position of the text on the screen.
+
+        Returns:
+            pygame.Rect: The area of the screen drawn over.
         """
-        high_score_text = self.font.render(
-            f"High Score: {high_score}", True, color
-        )
-        self.screen.blit(high_score_text, (300, 13))
+        high_score_text = self.get_text(f"High Score: {high_score}", color)
+        return self.screen.blit(high_score_text, (300, 13))
+
+    def get_text(self, text, color):
+        """
+        Gets a rendered line of HUD text, rendering it only the first time it
+        is requested.
+
+        Args:
+            text (str): The text to render.
+            color (tuple): The color of the text.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        key = (text, color)
+        text_surface = self.text_cache.get(key)
+        if text_surface is None:
+            text_surface = self.font.render(text, True, color)
+            self.text_cache[key] = text_surface
+            if len(self.text_cache) > self.TEXT_CACHE_SIZE:
+                del self.text_cache[next(iter(self.text_cache))]
+        return text_surface
 
-    def draw_object(self, game_object):
+    def get_blit_item(self, game_object):
         """
-        Draws a game object on the screen.
+        Rotates a game object's sprite to match its direction and computes
+        where it should be blitted.
 
         Args:
             game_object: An object in the game (fly/chameleon).
+
+        Returns:
+            tuple: The rotated surface and its blit position.
+        """
+        angle = round(game_object.direction.angle_to(UP)) % 360
+        rotated_surface, half_size = self.get_rotated_sprite(
+            game_object.sprite, angle
+        )
+        return rotated_surface, game_object.position - half_size
+
+    def get_rotated_sprite(self, sprite, angle):
         """
-        angle = game_object.direction.angle_to(UP)
-        if isinstance(game_object, Chameleon):
-            rotated_surface = rotozoom(game_object.sprite, angle, 1.0)
-            rotated_surface_size = Vector2(rotated_surface.get_size())
-            blit_position = game_object.position - rotated_surface_size * 0.5
-            self.screen.blit(rotated_surface, blit_position)
+        Gets a rotated copy of a sprite, rotating it only the first time the
+        angle is requested. Sprites that are not rotated at all are used as
+        they are. The least recently used rotations are dropped once the
+        cached copies exceed ROTATION_CACHE_BYTES.
+
+        Args:
+            sprite (pygame.Surface): The sprite to rotate.
+            angle (int): The rotation angle in whole degrees.
+
+        Returns:
+            tuple: The rotated sprite and a vector of half its size, used to
+            center it on a position.
+        """
+        key = (sprite, angle)
+        rotated = self.rotation_cache.get(key)
+        if rotated is None:
+            if angle == 0:
+                rotated_surface = sprite
+            else:
+                # rotozoom already returns a 32-bit per-pixel alpha surface.
+                rotated_surface = rotozoom(sprite, angle, 1.0)
+                self.rotation_cache_bytes += (
+                    rotated_surface.get_pitch() * rotated_surface.get_height()
+                )
+            rotated = (
+                rotated_surface,
+                Vector2(rotated_surface.get_size()) * 0.5,
+            )
+            self.rotation_cache[key] = rotated
+            while self.rotation_cache_bytes > self.ROTATION_CACHE_BYTES:
+                (old_sprite, _), (old_surface, _) = self.rotation_cache.popitem(
+                    last=False
+                )
+                if old_surface is not old_sprite:
+                    self.rotation_cache_bytes -= (
+                        old_surface.get_pitch() * old_surface.get_height()
+                    )
+        else:
+            self.rotation_cache.move_to_end(key)
+        return rotated
 
     def draw_game_over(self, score):
         """
@@ -256,11 +432,7 @@ class GameView:
             score (int): The player's score.
         """
         # Draw semi-transparent overlay
-        overlay = pygame.Surface(
-            (self.screen.get_width(), self.screen.get_height())
-        )
-        overlay.fill(self.overlay_color)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.game_over_overlay, (0, 0))
 
         # Draw game over text and display score
         game_over_text_line1 = self.game_over_font.render(
@@ -268,11 +440,7 @@ class GameView:
             True,
             (255, 0, 0),
         )
-        game_over_text_line2 = self.game_over_font.render(
-            "Press Enter to restart.",
-            True,
-            (255, 0, 0),
-        )
+        game_over_text_line2 = self.restart_text
         game_over_text_rect_line1 = game_over_text_line1.get_rect(
             center=(
                 self.screen.get_width() // 2,
@@ -287,7 +455,6 @@ class GameView:
         )
         self.screen.blit(game_over_text_line1, game_over_text_rect_line1)
         self.screen.blit(game_over_text_line2, game_over_text_rect_line2)
-        pygame.display.flip()
 
 
 # Controller
@@ -302,8 +469,17 @@ class GameController:
         running (bool): checks to see if the game loop is running
         show_instructions (bool): checks whether we are on initial screen
         game_over (bool): checks whether the game is on or over
+        instructions_drawn (bool): checks whether the instructions page is
+        already on screen, cleared when the window is exposed
+        game_over_drawn (bool): checks whether the game-over screen is already
+        on screen, cleared when the window is exposed
+        left_held (bool): checks whether the LEFT arrow key is held down
+        right_held (bool): checks whether the RIGHT arrow key is held down
     """
 
+    EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+    HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, *EXPOSE_EVENTS]
+
     def __init__(self, model, view):
         """
         Initializes the game controller with the model and view.
@@ -318,15 +494,25 @@ class GameController:
         self.running = True
         self.show_instructions = True
         self.game_over = False
+        self.instructions_drawn = False
+        self.game_over_drawn = False
+        self.left_held = False
+        self.right_held = False
         self._init_pygame()
 
     def _init_pygame(self):
         """
-        Initializes Pygame and sets up the game window.
+        Sets up event handling and the instructions page for the game window.
+
+        Pygame itself and the display are initialized by the entry point.
         """
-        pygame.init()
-        pygame.display.set_caption("Hungry Chameleon")
-        self.screen = pygame.display.set_mode((860, 600))
+        self.screen = pygame.display.get_surface()
+        # Keep SDL from queueing events the game never reads, so they are
+        # neither turned into Python objects nor left piling up in the queue.
+        # Expose events stay allowed: the game only repaints what changed, so
+        # it needs them to know when the window has lost its contents.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.HANDLED_EVENTS)
         self.instructions_font = pygame.font.Font("assets/fonts/Pulang.ttf", 26)
         self.instructions_message_font = pygame.font.Font(
             "assets/fonts/Pulang.ttf", 20
@@ -342,15 +528,19 @@ class GameController:
             "Press ESC at anytime to quit the game.",
         ]
         self.instructions_message = "P.S. Some flies are tougher than others and may need more than 1 attack"
+        self.instructions_surface = self._render_instructions()
 
     def handle_input(self):
         """
         Handles user inputs.
 
-        Responds to left and right keys to rotate the chameleon.
-        Exits the game if the quit event is triggered or if ESC key is pressed.
+        Tracks the left and right keys from their press and release events to
+        rotate the chameleon, and sticks its tongue out while SPACE is held.
+        Exits the game if the quit event is triggered or if ESC key is
+        pressed. Repaints the whole window once it has been exposed, since
+        its previous contents may have been lost.
         """
-        for event in pygame.event.get():
+        for event in pygame.event.get(self.HANDLED_EVENTS):
             if event.type == pygame.QUIT or (
                 event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
             ):
@@ -359,94 +549,107 @@ class GameController:
                 if self.show_instructions:
                     self.show_instructions = False
                 elif self.game_over:
-                    self.model = GameModel(self.screen)
+                    self.model.reset()
                     self.game_over = False
+            elif event.type in self.EXPOSE_EVENTS:
+                self.view.previous_rects = None
+                self.instructions_drawn = False
+                self.game_over_drawn = False
+            if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                held = event.type == pygame.KEYDOWN
+                if event.key == pygame.K_LEFT:
+                    self.left_held = held
+                elif event.key == pygame.K_RIGHT:
+                    self.right_held = held
+                elif event.key == pygame.K_SPACE and self.model.chameleon:
+                    self.model.chameleon.tongue = held
+                    self.model.chameleon.change_sprite()
+
+        # Look the chameleon up after the events, since Enter may have
+        # restarted the game with a new chameleon.
+        chameleon = self.model.chameleon
+        if chameleon:
+            if self.left_held:
+                chameleon.rotate(clockwise=False)
+            if self.right_held:
+                chameleon.rotate(clockwise=True)
+
+    def _render_instructions(self):
+        """
+        Renders the instructions page once so it can be blitted as a whole.
 
-        if self.model.chameleon:
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT]:
-                self.model.chameleon.rotate(clockwise=False)
-            if keys[pygame.K_RIGHT]:
-                self.model.chameleon.rotate(clockwise=True)
-            if keys[pygame.K_SPACE]:
-                self.model.chameleon.tongue = True
-                self.model.chameleon.change_sprite()
-            else:
-                self.model.chameleon.tongue = False
-
-    def display_instructions(self):
-        """
-        Displays the instructions of the game before playing
+        Returns:
+            pygame.Surface: The rendered instructions page.
         """
+        surface = pygame.Surface(self.screen.get_size()).convert()
         # Fill screen with green background
-        self.screen.fill((107, 142, 35))
+        surface.fill((107, 142, 35))
         y_offset = (
-            self.screen.get_height() - (len(self.instructions_text) + 2) * 40
+            surface.get_height() - (len(self.instructions_text) + 2) * 40
         ) // 2
         for line in self.instructions_text:
             text_surface = self.instructions_font.render(line, True, (0, 0, 0))
             text_rect = text_surface.get_rect(
-                center=(self.screen.get_width() // 2, y_offset)
+                center=(surface.get_width() // 2, y_offset)
             )
-            self.screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
             y_offset += 40
         instructions_message_surface = self.instructions_message_font.render(
             self.instructions_message, True, (0, 0, 0)
         )
         instructions_message_rect = instructions_message_surface.get_rect(
-            center=(self.screen.get_width() // 2, y_offset + 20)
-        )
-        self.screen.blit(
-            instructions_message_surface, instructions_message_rect
+            center=(surface.get_width() // 2, y_offset + 20)
         )
-        pygame.display.flip()
+        surface.blit(instructions_message_surface, instructions_message_rect)
+        return surface
 
-    def handle_game_over_input(self):
+    def display_instructions(self):
         """
-        Handles user input when the game is over.
-
-        Returns:
-            bool: True if the game should restart, False otherwise.
+        Displays the instructions of the game before playing
         """
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                return True
-            if event.type == pygame.QUIT:
-                self.running = False
-                return False
-        return False
+        self.screen.blit(self.instructions_surface, (0, 0))
+        pygame.display.flip()
 
     def run(self):
         """
-        Initial running game loop, used to remove instructions when enter is
-        pressed.
+        Runs the game until it is quit, one frame per loop iteration. Shows
+        the instructions until enter is pressed, then plays the game and
+        shows the game-over screen whenever the chameleon is caught.
         """
         while self.running:
+            if self.model.chameleon is None:
+                self.game_over = True
             self.handle_input()
             if self.show_instructions:
-                self.display_instructions()
+                if not self.instructions_drawn:
+                    self.display_instructions()
+                    self.instructions_drawn = True
+                # The instructions page is static, so just poll for input at
+                # a relaxed rate while it is showing. An expose clears
+                # instructions_drawn to have it presented again.
+                self.clock.tick(30)
+            elif self.game_over and self.game_over_drawn:
+                # The game-over screen is static until Enter restarts the game
+                # or an expose clears game_over_drawn to present it again.
+                self.clock.tick(30)
             else:
-                self.game_loop()
+                self.game_frame()
+                self.clock.tick(60)
+        self.model.flush_high_score()
         pygame.quit()
 
-    def game_loop(self):
+    def game_frame(self):
         """
-        Game loop. Calls appropriate functions to make the game and input work
-        correctly.
+        Advances the game by one frame, updating the model and drawing it.
+        Once the game is over the model is left as it is, so presenting the
+        game-over screen again does not move the flies beneath it.
         """
-        while self.running:
-            if self.model.chameleon is None:
-                self.game_over = True
-            self.handle_input()
+        if not self.game_over:
             self.model.update()
-            self.view.draw(
-                self.model.get_game_objects(),
-                self.model.score,
-                self.model.high_score,
-                game_over=self.game_over,
-            )
-            if self.game_over:
-                if self.handle_game_over_input():
-                    self.model = GameModel(self.screen)
-                    self.game_over = False
-            self.clock.tick(60)
+        self.view.draw(
+            self.model.get_game_objects(),
+            self.model.score,
+            self.model.high_score,
+            game_over=self.game_over,
+        )
+        self.game_over_drawn = self.game_over
@@ -3,7 +3,7 @@ This module defines the basic game objects for a simple Pygame-based game.
 
 Classes:
     GameObject: A base class for all movable entities in the game, providing
-    common functionality such as drawing, moving, and collision detection.
+    common functionality such as moving and collision detection.
     Chameleon: A specialized GameObject that represents the player's character.
     It can rotate and potentially stick out its tongue as part of its
     interaction in the game.
@@ -11,11 +11,9 @@ Classes:
     be caught by the Chameleon.
 """
 
-import pygame
 from pygame.math import Vector2
-from pygame.transform import rotozoom
 
-from utils import load_sprite, wrap_position, get_random_velocity
+from utils import get_scaled_sprite, get_random_velocity
 
 UP = Vector2(0, -1)
 
@@ -33,6 +31,7 @@ class GameObject:
         velocity (Vector2): The velocity of the object, dictating its movement
         per frame.
         screen (pygame.Surface): The screen on which the object is drawn.
+        screen_size (tuple): The width and height of the screen.
     """
 
     def __init__(self, position, sprite, velocity, screen):
@@ -50,16 +49,19 @@ class GameObject:
         self.radius = sprite.get_width() / 2
         self.velocity = Vector2(velocity)
         self.screen = screen
+        self.screen_size = screen.get_size()
 
     def move(self):
         """
         Updates the object's position based on its velocity.
 
-        Wraps the position around the screen boundaries if needed.
+        Wraps the position around the screen boundaries if needed. The
+        position is updated in place rather than replaced with a new vector.
         """
-        self.position = wrap_position(
-            self.position + self.velocity, self.screen
-        )
+        width, height = self.screen_size
+        position = self.position
+        position.x = (position.x + self.velocity.x) % width
+        position.y = (position.y + self.velocity.y) % height
 
     def collides_with(self, other_obj):
         """
@@ -73,11 +75,13 @@ class GameObject:
             bool: True if there is a collision; otherwise, False.
         """
         if other_obj:
-            distance = self.position.distance_to(other_obj.position)
-            if hasattr(other_obj, "tongue"):
-                if other_obj.tongue:
-                    return distance < (self.radius + other_obj.radius + 100)
-            return distance < (self.radius + other_obj.radius - 10)
+            # Compare squared distances to avoid taking a square root.
+            distance_sq = self.position.distance_squared_to(other_obj.position)
+            if getattr(other_obj, "tongue", False):
+                reach = self.radius + other_obj.radius + 100
+            else:
+                reach = self.radius + other_obj.radius - 10
+            return reach > 0 and distance_sq < reach * reach
 
 
 class Chameleon(GameObject):
@@ -91,7 +95,6 @@ class Chameleon(GameObject):
         tongue (bool): A boolean that turns True if the chameleon tongue is out
         tongue_out (pygame.Surface): The sprite with the tongue out
         no_tongue (pygame.Surface): The sprite with no tognue
-        tongue_start_time (int): Holds time elapsed since spacebar pressed.
 
     """
 
@@ -106,23 +109,15 @@ class Chameleon(GameObject):
             rotation_point (tuple): The pivot point of the sprite used
             screen (pygame.Surface): The screen on which the Chameleon is drawn.
         """
-        self.direction = Vector2(UP)
+        self.direction = UP.copy()
         self.tongue = False
-        self.tongue_out = pygame.transform.scale(
-            load_sprite("chameleon_with_tongue"), (150, 500)
-        )
-
-        self.no_tongue = pygame.transform.scale(
-            load_sprite("chameleon_no_tongue"), (150, 500)
-        )
-        self.tongue_start_time = 0
+        self.tongue_out = get_scaled_sprite("chameleon_with_tongue", (150, 500))
+        self.no_tongue = get_scaled_sprite("chameleon_no_tongue", (150, 500))
 
         super().__init__(
             position,
-            pygame.transform.scale(
-                load_sprite("chameleon_no_tongue"), (150, 500)
-            ),
-            Vector2(0),
+            self.no_tongue,
+            (0, 0),
             screen,
         )
         self.rotation_point = Vector2(rotation_point)
@@ -138,58 +133,19 @@ class Chameleon(GameObject):
         sign = 1 if clockwise else -1
         angle = self.MANEUVERABILITY * sign
         self.direction.rotate_ip(angle)
-        self.position = self.rotation_point + (
-            self.position - self.rotation_point
-        ).rotate(angle)
-
-    def draw(self):
-        """
-        Draws the Chameleon with the current rotation applied to the
-        sprite.
-        """
-        angle = self.direction.angle_to(UP)
-        rotated_surface = rotozoom(self.sprite, angle, 1.0)
-        rotated_surface_size = Vector2(rotated_surface.get_size())
-        blit_position = self.position - rotated_surface_size * 0.5
-        self.screen.blit(rotated_surface, blit_position)
-        self.sprite = self.no_tongue
+        # Rotate about the pivot in place instead of building new vectors.
+        self.position -= self.rotation_point
+        self.position.rotate_ip(angle)
+        self.position += self.rotation_point
 
     def change_sprite(self):
         """
-        Changes chameleon sprite based on spacebar press.
+        Changes chameleon sprite based on whether its tongue is out.
         """
-        keys = pygame.key.get_pressed()
-
-        if keys[pygame.K_SPACE]:
+        if self.tongue:
             self.sprite = self.tongue_out
-            self.tongue = True
-            self.tongue_start_time = pygame.time.get_ticks()
-        elif (
-            self.tongue
-            and pygame.time.get_ticks() - self.tongue_start_time >= 1000
-        ):
-            self.sprite = self.no_tongue
-            self.tongue = False
-
-        self.update_tongue_time()
-
-    def update_tongue_time(self):
-        """
-        Updates the tongue time.
-        """
-        if (
-            self.tongue
-            and pygame.time.get_ticks() - self.tongue_start_time >= 1000
-        ):
+        else:
             self.sprite = self.no_tongue
-            self.tongue = False
-
-    def move(self):
-        """
-        Moves the chameleon and changes its sprite.
-        """
-        self.change_sprite()
-        super().move()
 
 
 class Fly(GameObject):
@@ -211,25 +167,15 @@ class Fly(GameObject):
             position (tuple): The initial position of the Fly.
             screen (pygame.Surface): The screen on which the Fly is drawn.
         """
-        self.direction = Vector2(UP)
+        self.direction = UP.copy()
 
         super().__init__(
             position,
-            pygame.transform.scale(load_sprite("fly"), (30, 30)),
+            get_scaled_sprite("fly", (30, 30)),
             get_random_velocity(1, 2),
             screen,
         )
 
-    def draw(self):
-        """
-        Draws the Fly with the current rotation applied to the sprite.
-        """
-        angle = self.direction.angle_to(UP)
-        rotated_surface = rotozoom(self.sprite, angle, 1.0)
-        rotated_surface_size = Vector2(rotated_surface.get_size())
-        blit_position = self.position - rotated_surface_size * 0.5
-        self.screen.blit(rotated_surface, blit_position)
-
     def rotate(self, clockwise=True):
         """
         Rotates the Fly either clockwise or counterclockwise.
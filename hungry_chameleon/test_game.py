@@ -22,11 +22,15 @@ def screen():
 
 
 @pytest.fixture(name="test_game_model")
-def game_model(test_screen):
+def game_model(test_screen, tmp_path):
     """
-    Provides a GameModel instance for testing.
+    Provides a GameModel instance for testing, keeping its high score in a
+    temporary file rather than the repository's HIGH_SCORE_FILE.txt.
     """
-    return GameModel(test_screen)
+    model = GameModel(test_screen)
+    model.high_score_file = tmp_path / "HIGH_SCORE_FILE.txt"
+    model.high_score_file.write_text("0")
+    return model
 
 
 @pytest.fixture(name="test_game_view")
@@ -114,3 +118,212 @@ def test_game_controller_input_handling(test_game_controller):
     )
     test_game_controller.handle_input()
     assert not test_game_controller.running
+
+
+def test_game_view_get_blit_item(test_game_model, test_game_view):
+    """
+    Tests that GameView computes a blit item centered on the game object's
+    position.
+    """
+    fly = test_game_model.fly[0]
+    surface, position = test_game_view.get_blit_item(fly)
+    assert isinstance(surface, pygame.Surface)
+    assert position + pygame.math.Vector2(surface.get_size()) * 0.5 == (
+        fly.position
+    )
+
+
+def test_game_view_get_rotated_sprite(test_game_model, test_game_view):
+    """
+    Tests that GameView reuses rotated sprites for angles it has already
+    rotated to.
+    """
+    sprite = test_game_model.chameleon.sprite
+    rotated, half_size = test_game_view.get_rotated_sprite(sprite, 90)
+    assert half_size == pygame.math.Vector2(rotated.get_size()) * 0.5
+    assert test_game_view.get_rotated_sprite(sprite, 90)[0] is rotated
+    assert test_game_view.get_rotated_sprite(sprite, 93)[0] is not rotated
+
+
+def test_game_controller_key_state(test_game_controller):
+    """
+    Tests that GameController tracks held keys from press and release events.
+    """
+    pygame.event.post(
+        pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_LEFT})
+    )
+    test_game_controller.handle_input()
+    assert test_game_controller.left_held
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, {"key": pygame.K_LEFT}))
+    test_game_controller.handle_input()
+    assert not test_game_controller.left_held
+
+
+def test_game_view_get_rotated_sprite_unrotated(
+    test_game_model, test_game_view
+):
+    """
+    Tests that GameView uses a sprite as it is when it is not rotated.
+    """
+    sprite = test_game_model.fly[0].sprite
+    assert test_game_view.get_rotated_sprite(sprite, 0)[0] is sprite
+
+
+def test_game_model_check_collisions_eats_flies(test_game_model):
+    """
+    Tests that GameModel removes and scores every fly the chameleon catches
+    with its tongue out in the same frame.
+    """
+    test_game_model.high_score = 0
+    chameleon = test_game_model.chameleon
+    chameleon.tongue = True
+    for fly in test_game_model.fly[:2]:
+        fly.position = pygame.math.Vector2(chameleon.position)
+    test_game_model.check_collisions()
+    assert test_game_model.score == 200
+    assert test_game_model.chameleon is chameleon
+    assert len(test_game_model.get_game_objects()) == 5
+    assert not test_game_model.high_score_saved
+
+
+def test_game_view_get_text(test_game_view):
+    """
+    Tests that GameView renders each line of HUD text only once.
+    """
+    text = test_game_view.get_text("Score: 100", (0, 0, 0))
+    assert test_game_view.get_text("Score: 100", (0, 0, 0)) is text
+    assert test_game_view.get_text("Score: 200", (0, 0, 0)) is not text
+
+
+def test_game_model_flush_high_score(test_game_model):
+    """
+    Tests that GameModel only writes the high score file once the high score
+    has been beaten.
+    """
+    test_game_model.high_score = 100
+    test_game_model.save_high_score()
+    test_game_model.high_score = 200
+    test_game_model.flush_high_score()
+    assert test_game_model.load_high_score() == 100
+    test_game_model.high_score_saved = False
+    test_game_model.flush_high_score()
+    assert test_game_model.load_high_score() == 200
+
+
+def test_game_controller_tongue(test_game_controller):
+    """
+    Tests that GameController sticks the chameleon's tongue out when SPACE is
+    pressed and pulls it back in when SPACE is released.
+    """
+    chameleon = test_game_controller.model.chameleon
+    pygame.event.post(
+        pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_SPACE})
+    )
+    test_game_controller.handle_input()
+    assert chameleon.tongue
+    assert chameleon.sprite is chameleon.tongue_out
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, {"key": pygame.K_SPACE}))
+    test_game_controller.handle_input()
+    assert not chameleon.tongue
+    assert chameleon.sprite is chameleon.no_tongue
+
+
+def test_game_model_reset(test_game_model):
+    """
+    Tests that GameModel starts a new game on reset while keeping the high
+    score.
+    """
+    test_game_model.score = 300
+    test_game_model.high_score = 300
+    test_game_model.chameleon = None
+    test_game_model.game_over = True
+    test_game_model.reset()
+    assert test_game_model.chameleon is not None
+    assert len(test_game_model.fly) == 6
+    assert test_game_model.score == 0
+    assert test_game_model.high_score == 300
+    assert not test_game_model.game_over
+
+
+def test_game_model_fly_move_wraps(test_game_model):
+    """
+    Tests that moving a fly wraps its position around the screen in place.
+    """
+    fly = test_game_model.fly[0]
+    position = fly.position
+    fly.position.update(799, 599)
+    fly.velocity.update(2, 3)
+    fly.move()
+    assert fly.position is position
+    assert fly.position == pygame.math.Vector2(1, 2)
+
+
+def test_game_view_rotation_cache_budget(test_game_model, test_game_view):
+    """
+    Tests that GameView drops the oldest rotations once the rotated copies
+    exceed the cache's byte budget.
+    """
+    sprite = test_game_model.chameleon.sprite
+    test_game_view.ROTATION_CACHE_BYTES = 2 * 1024 * 1024
+    for angle in range(3, 360, 3):
+        test_game_view.get_rotated_sprite(sprite, angle)
+    cache = test_game_view.rotation_cache
+    assert 0 < len(cache) < 119
+    assert (sprite, 3) not in cache
+    assert test_game_view.rotation_cache_bytes <= 2 * 1024 * 1024
+    assert test_game_view.rotation_cache_bytes == sum(
+        surface.get_pitch() * surface.get_height()
+        for surface, _ in cache.values()
+    )
+
+
+def test_game_view_draw_dirty_rects(test_game_model, test_game_view):
+    """
+    Tests that GameView remembers the areas it drew over, redraws the whole
+    screen after game over and only repaints what changed in between.
+    """
+    game_objects = test_game_model.get_game_objects()
+    test_game_view.draw(game_objects, 0, 0)
+    assert len(test_game_view.previous_rects) == len(game_objects) + 2
+    assert all(
+        isinstance(rect, pygame.Rect) for rect in test_game_view.previous_rects
+    )
+
+    test_game_model.fly[0].position += pygame.math.Vector2(40, 40)
+    test_game_view.draw(game_objects, 100, 200)
+    partial_frame = pygame.image.tobytes(test_game_view.screen, "RGB")
+    test_game_view.previous_rects = None
+    test_game_view.draw(game_objects, 100, 200)
+    assert partial_frame == pygame.image.tobytes(test_game_view.screen, "RGB")
+
+    test_game_view.draw(game_objects, 100, 200, game_over=True)
+    assert test_game_view.previous_rects is None
+
+
+def test_game_controller_expose_redraws(test_game_controller):
+    """
+    Tests that GameController repaints the whole window after it has been
+    exposed.
+    """
+    test_game_controller.view.previous_rects = []
+    test_game_controller.instructions_drawn = True
+    test_game_controller.game_over_drawn = True
+    pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+    test_game_controller.handle_input()
+    assert test_game_controller.view.previous_rects is None
+    assert not test_game_controller.instructions_drawn
+    assert not test_game_controller.game_over_drawn
+
+
+def test_game_controller_game_over_frame(test_game_controller):
+    """
+    Tests that GameController redraws the game-over screen without advancing
+    the game beneath it.
+    """
+    fly = test_game_controller.model.fly[0]
+    position = pygame.math.Vector2(fly.position)
+    test_game_controller.model.chameleon = None
+    test_game_controller.game_over = True
+    test_game_controller.game_frame()
+    assert fly.position == position
+    assert test_game_controller.game_over_drawn
@@ -2,8 +2,8 @@
 Unit tests for the utility functions in the utils module.
 
 This module contains tests for various utility functions that support game
-functionality, including sprite loading, position wrapping, and random
-position and velocity generation.
+functionality, including sprite loading and random position and velocity
+generation.
 """
 
 import pytest
@@ -11,7 +11,7 @@ import pygame
 
 from utils import (
     load_sprite,
-    wrap_position,
+    get_scaled_sprite,
     get_random_position,
     get_random_velocity,
 )
@@ -36,13 +36,15 @@ def test_load_sprite():
     assert isinstance(sprite, pygame.Surface)
 
 
-def test_wrap_position(test_screen):
+@pytest.mark.usefixtures("test_screen")
+def test_get_scaled_sprite():
     """
-    Tests that wrap_position correctly wraps a position around the screen
-    boundaries when exceeding them.
+    Tests that get_scaled_sprite scales a sprite to the requested size and
+    reuses it for later requests of the same size.
     """
-    pos = wrap_position(pygame.math.Vector2(810, 610), test_screen)
-    assert 0 <= pos.x < 800 and 0 <= pos.y < 600
+    sprite = get_scaled_sprite("fly", (30, 30))
+    assert sprite.get_size() == (30, 30)
+    assert get_scaled_sprite("fly", (30, 30)) is sprite
 
 
 def test_get_random_position(test_screen):
@@ -50,7 +52,7 @@ def test_get_random_position(test_screen):
     Tests that get_random_position generates a position within the screen
     boundaries.
     """
-    pos = get_random_position(test_screen)
+    pos = get_random_position(*test_screen.get_size())
     assert 0 <= pos.x < 800 and 0 <= pos.y < 600
 
 
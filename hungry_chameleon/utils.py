@@ -4,16 +4,23 @@ Helper functions for a Pygame-based game, Hungry Chameleon.
 Functions:
     load_sprite: Loads and optionally converts a sprite image from the assets
     directory.
-    wrap_position: Wraps a game object's position to keep it within the screen
-    boundaries.
+    get_scaled_sprite: Loads, scales and converts a sprite once and reuses it
+    for later requests of the same size.
     get_random_position: Generates a random position within the screen bounds.
     get_random_velocity: Generates a random velocity vector within specified
     speed limits.
 """
 
+import math
 import random
 from pygame.image import load
 from pygame.math import Vector2
+from pygame.transform import scale
+
+_SPRITE_CACHE = {}
+# Unit vector components for every whole-degree direction.
+_COS = tuple(math.cos(math.radians(angle)) for angle in range(360))
+_SIN = tuple(math.sin(math.radians(angle)) for angle in range(360))
 
 
 def load_sprite(name, with_alpha=True):
@@ -37,38 +44,46 @@ def load_sprite(name, with_alpha=True):
     return loaded_sprite.convert()
 
 
-def wrap_position(position, screen):
+def get_scaled_sprite(name, size, with_alpha=True):
     """
-    Wraps the position around the edges of the surface to create a seamless
-    effect.
+    Gets a sprite scaled to the given size, loading and scaling it only the
+    first time it is requested.
 
     Args:
-        position (Vector2): The original position vector.
-        screen (pygame.Surface): The surface whose dimensions to use for
-        wrapping.
+        name (str): The name of the sprite file (without file extension).
+        size (tuple): The width and height to scale the sprite to.
+        with_alpha (bool): If True, convert the sprite to include an alpha
+        channel.
 
     Returns:
-        The wrapped position vector.
+        The scaled and converted sprite, shared by every caller asking for
+        the same sprite, size and conversion.
     """
-    x, y = position
-    w, h = screen.get_size()
-    return Vector2(x % w, y % h)
+    key = (name, tuple(size), with_alpha)
+    sprite = _SPRITE_CACHE.get(key)
+    if sprite is None:
+        # Only the scaled copy needs converting, not the full-size source.
+        sprite = scale(load(f"assets/sprites/{name}.png"), size)
+        sprite = sprite.convert_alpha() if with_alpha else sprite.convert()
+        _SPRITE_CACHE[key] = sprite
+    return sprite
 
 
-def get_random_position(screen):
+def get_random_position(width, height):
     """
-    Generates a random position within the boundaries of the given screen.
+    Generates a random position within the boundaries of a surface of the
+    given size.
 
     Args:
-        screen (pygame.Surface): The surface to get the width and height for
-        boundaries.
+        width (int): The width of the surface.
+        height (int): The height of the surface.
 
     Returns:
-        A vector representing a random position within the screen.
+        A vector representing a random position within the surface.
     """
     return Vector2(
-        random.randrange(screen.get_width()),
-        random.randrange(screen.get_height()),
+        random.randrange(width),
+        random.randrange(height),
     )
 
 
@@ -86,4 +101,4 @@ def get_random_velocity(min_speed, max_speed):
     """
     speed = random.randint(min_speed, max_speed)
     angle = random.randrange(0, 360)
-    return Vector2(speed, 0).rotate(angle)
+    return Vector2(speed * _COS[angle], speed * _SIN[angle])